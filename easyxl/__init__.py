@@ -6,5 +6,5 @@ from .base import (
     NewExcelTable,
 )
 from .editor import WorkbookEditor
-from .reader import WorkbookReader
+from .reader import WorkbookReader, ReadOnlyWorkbookReader
 from .creator import WorkbookCreator
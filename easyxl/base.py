@@ -1,4 +1,7 @@
-from typing import Optional, Any, Sequence, Collection, Mapping, Literal
+from typing import Optional, Any, Iterator, Sequence, Collection, Mapping, Literal
+from functools import cached_property
+from itertools import count, zip_longest
+from operator import itemgetter
 
 try:
     from typing import Self
@@ -10,6 +13,8 @@ from easyxl.exceptions import InvalidFile, InvalidSheet, InvalidRangeFormat
 
 from openpyxl import Workbook, load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 from openpyxl.worksheet.table import Table, TableStyleInfo
 from openpyxl.cell.cell import Cell
 from openpyxl.styles.alignment import Alignment
@@ -17,14 +22,31 @@ from openpyxl.worksheet.cell_range import CellRange
 from openpyxl.utils.cell import (
     coordinate_from_string,
     column_index_from_string,
+    get_column_letter,
 )
 
 
 Coordinate = tuple[int, int]
-TableData = Sequence[Sequence[Any]] | Sequence[dict[str, Any]]
+TableData = (
+    Sequence[Sequence[Any]] | Sequence[dict[str, Any]] | Mapping[str, Sequence[Any]]
+)
+
+
+def _row_has_value(row: Sequence[Any]) -> bool:
+    # whitespace-only strings and falsy values count as empty; the plain
+    # loop keeps the all-empty case to one truth test per cell, with the
+    # strip only paid for truthy strings
+    for v in row:
+        if v:
+            if type(v) is str and not v.strip():
+                continue
+            return True
+    return False
 
 
 class ExcelRange:
+    _str_cache: Optional[str] = None
+
     def __init__(
         self,
         worksheet: Worksheet,
@@ -41,13 +63,19 @@ class ExcelRange:
                 )
         elif coordinates is not None:
             try:
+                # cheap fail-fast on out-of-sheet coordinates before
+                # openpyxl runs its own validation
+                if coordinates[0][0] < 1 or coordinates[0][1] < 1:
+                    raise InvalidRangeFormat(
+                        f"{coordinates[0]}, {coordinates[1]} are invalid coordinate pairs"
+                    )
                 self._range = CellRange(
                     min_row=coordinates[0][0],
                     min_col=coordinates[0][1],
                     max_row=coordinates[1][0],
                     max_col=coordinates[1][1],
                 )
-            except ValueError | TypeError:
+            except (ValueError, TypeError):
                 raise InvalidRangeFormat(
                     f"{coordinates[0]}, {coordinates[1]} are invalid coordinate pairs"
                 )
@@ -55,7 +83,33 @@ class ExcelRange:
             raise InvalidRangeFormat("No expression or coordinates given")
 
     def __str__(self) -> str:
-        return self._range.__str__()
+        # CellRange re-runs column-letter formatting on every
+        # serialization, so keep the A1 form until the bounds change
+        if self._str_cache is None:
+            self._str_cache = self._range.__str__()
+        return self._str_cache
+
+    @classmethod
+    def _from_ints(
+        cls,
+        worksheet: Worksheet,
+        min_row: int,
+        min_col: int,
+        max_row: int,
+        max_col: int,
+    ) -> Self:
+        # internal constructor for bounds we already know are valid;
+        # skips the coordinate checks and exception wrapping of __init__
+        rng = cls.__new__(cls)
+        rng.ws = worksheet
+        rng._range = CellRange(
+            min_row=min_row, min_col=min_col, max_row=max_row, max_col=max_col
+        )
+        return rng
+
+    @property
+    def bounds(self) -> tuple[int, int, int, int]:
+        return self._range.bounds
 
     @property
     def row_bounds(self) -> tuple[int, int]:
@@ -64,33 +118,38 @@ class ExcelRange:
 
     @property
     def column_bounds(self) -> tuple[str, str]:
-        range_parts = self._range.__str__().split(":")
-        return (
-            coordinate_from_string(range_parts[0])[0],
-            coordinate_from_string(range_parts[-1])[0],
-        )
+        min_col, _, max_col, _ = self._range.bounds
+        return get_column_letter(min_col), get_column_letter(max_col)
 
-    @property
+    def iter_rows(self) -> Iterator[Self]:
+        # built from integer bounds: CellRange.rows would allocate a list
+        # of coordinate tuples per row just to take its two endpoints
+        min_col, min_row, max_col, max_row = self._range.bounds
+        for r in range(min_row, max_row + 1):
+            yield type(self)._from_ints(self.ws, r, min_col, r, max_col)
+
+    def iter_cells(self) -> Iterator[Cell]:
+        for coord in self._range.cells:
+            yield self.ws.cell(*coord)  # type: ignore
+
+    @cached_property
     def rows(self) -> Sequence[Self]:
-        range_rows: list[Self] = []
-        for row in self._range.rows:
-            range_rows.append(type(self)(self.ws, coordinates=(row[0], row[-1])))
-        return range_rows
+        return list(self.iter_rows())
 
     @property
     def next_row(self) -> Self:
-        bottom_row = type(self)(
-            self.ws, coordinates=(self._range.bottom[0], self._range.bottom[1])
+        min_col, _, max_col, max_row = self._range.bounds
+        return type(self)._from_ints(
+            self.ws, max_row + 1, min_col, max_row + 1, max_col
         )
-        bottom_row._range.shift(row_shift=1)
-        return bottom_row
 
-    @property
+    @cached_property
     def columns(self) -> list[Self]:
-        range_columns: list[Self] = []
-        for col in self._range.cols:
-            range_columns.append(type(self)(self.ws, coordinates=(col[0], col[-1])))
-        return range_columns
+        min_col, min_row, max_col, max_row = self._range.bounds
+        return [
+            type(self)._from_ints(self.ws, min_row, c, max_row, c)
+            for c in range(min_col, max_col + 1)
+        ]
 
     def get_column_from_index(self, index: int | str) -> Self:
         def column_from_letter(letter: str) -> Self:
@@ -99,23 +158,28 @@ class ExcelRange:
             col_start = column_index_from_string(col_start_letter)
             return self.columns[ws_column_index - col_start]
 
-        if type(index) == int:
+        if isinstance(index, int):
             return self.columns[index]
-        elif type(index) == str and index.isalpha():
+        elif isinstance(index, str) and index.isalpha():
             return column_from_letter(index)
-        elif type(index) == str and index.isalnum():
+        elif isinstance(index, str) and index.isalnum():
             col_letter = coordinate_from_string(index)[0]
             return column_from_letter(col_letter)
         else:
             raise Exception(f"Supplied index '{index}' is not valid")
 
-    @property
+    @cached_property
     def column_letters(self) -> list[str]:
         return [cell.column_letter for cell in self.rows[0].cells]
 
-    @property
+    @cached_property
     def cells(self) -> list[Cell]:
-        return [self.ws.cell(*cell) for cell in self._range.cells]  # type: ignore
+        # one worksheet slice returns the whole block of cells in a single
+        # call instead of a ws.cell dispatch per coordinate
+        block = self.ws[str(self._range)]
+        if isinstance(block, Cell):
+            return [block]
+        return [cell for row in block for cell in row]
 
     @property
     def cells_matrix(self) -> list[list[Cell]]:
@@ -124,48 +188,73 @@ class ExcelRange:
             matrix.append([c for c in row.cells])
         return matrix
 
+    def iter_values(self) -> Iterator[tuple]:
+        # one streaming values_only walk over the block; every value-level
+        # scan funnels through here so none of them allocate Cell objects
+        min_col, min_row, max_col, max_row = self._range.bounds
+        yield from self.ws.iter_rows(
+            min_row=min_row,
+            max_row=max_row,
+            min_col=min_col,
+            max_col=max_col,
+            values_only=True,
+        )
+
     @property
     def values(self) -> list[list]:
-        data: list[list] = []
-        for row in self.rows:
-            data.append([c.value for c in row.cells])
-        return data
+        return [list(row) for row in self.iter_values()]
 
     @property
     def first_free_row(self) -> Self | None:
-        for row in self.rows:
-            if row.is_empty():
-                return row
-        else:
-            return None
+        # scan values in one stream and only wrap the winning row
+        min_col, min_row, max_col, max_row = self._range.bounds
+        for r, row in enumerate(self.iter_values(), start=min_row):
+            if not _row_has_value(row):
+                return type(self)._from_ints(self.ws, r, min_col, r, max_col)
+        return None
 
     @property
     def last_free_block(self) -> Self | None:
-        free_rows_reversed: list[ExcelRange] = []
-        for row in reversed(self.rows):
-            if row.is_empty():
-                free_rows_reversed.append(row)
+        # walk bottom-up and stop at the first filled row: only the rows
+        # below it can belong to the trailing free block, so the filled
+        # head of the range is never read
+        min_col, min_row, max_col, max_row = self._range.bounds
+
+        first_free_row = max_row + 1
+        for row_index in range(max_row, min_row - 1, -1):
+            row_values = next(
+                self.ws.iter_rows(
+                    min_row=row_index,
+                    max_row=row_index,
+                    min_col=min_col,
+                    max_col=max_col,
+                    values_only=True,
+                )
+            )
+            if _row_has_value(row_values):
+                break
+            first_free_row = row_index
 
-        if not free_rows_reversed:
+        if first_free_row > max_row:
             return None
 
-        top_left = free_rows_reversed[-1].cells[0].coordinate
-        bottom_right = free_rows_reversed[0].cells[-1].coordinate
-        return type(self)(self.ws, f"{top_left}:{bottom_right}")
+        return type(self)._from_ints(self.ws, first_free_row, min_col, max_row, max_col)
 
     def is_empty(self) -> bool:
-        for cell in self.cells:
-            if type(cell.value) == str and cell.value.strip():  # type: ignore
-                return False
-            elif cell.value:
-                return False
-        else:
-            return True
+        # any() drives the generator at the C level and stops at the
+        # first filled row
+        return not any(_row_has_value(row) for row in self.iter_values())
 
     def expand(self, right: int = 0, down: int = 0, left: int = 0, up: int = 0) -> str:
         self._range.expand(right, down, left, up)
+        self._invalidate_bounds_cache()
         return self.__str__()
 
+    def _invalidate_bounds_cache(self) -> None:
+        self._str_cache = None
+        for cached in ("rows", "columns", "cells", "column_letters"):
+            self.__dict__.pop(cached, None)
+
     def issubset(self, other: "ExcelRange") -> bool:
         return self._range.issubset(other._range)
 
@@ -173,7 +262,8 @@ class ExcelRange:
         return self._range.issuperset(other._range)
 
     def contains_cells(self, cell: Cell) -> bool:
-        return self._range.issuperset(CellRange(cell.coordinate))
+        min_col, min_row, max_col, max_row = self._range.bounds
+        return min_row <= cell.row <= max_row and min_col <= cell.column <= max_col
 
 
 class ExcelRangeWritable(ExcelRange):
@@ -182,25 +272,39 @@ class ExcelRangeWritable(ExcelRange):
         return ExcelRangeWritable(range.ws, str(range))
 
     def write_to_row(self, index: int, data: Collection[str]) -> None:
-        try:
-            row = self.rows[index]
-        except IndexError:
+        if isinstance(self.ws, ReadOnlyWorksheet):
+            raise Exception(f"Cannot write to {self}: workbook was opened read_only")
+
+        # write-only worksheets are append-only streams, so rows can only
+        # ever land below what has already been emitted
+        if isinstance(self.ws, WriteOnlyWorksheet):
+            self.ws.append(list(data))
+            return
+
+        min_col, min_row, max_col, max_row = self._range.bounds
+        target_row = min_row + index
+
+        if index < 0 or target_row > max_row:
             raise Exception(
                 f"Tried writing to row '{index}' of {self}"
                 + " but that row is outside of the range."
             )
 
-        if len(row.cells) < len(data):
+        width = max_col - min_col + 1
+        if width < len(data):
             raise Exception(
-                f"Row size of range {self} is '{len(row.cells)}'"
+                f"Row size of range {self} is '{width}'"
                 + f" but input data is size '{len(data)}'"
             )
 
+        # write straight to worksheet coordinates instead of materializing
+        # a sub-range and its cell list just to assign values
+        ws_cell = self.ws.cell
         for i, item in enumerate(data):
-            row.cells[i].value = item
+            ws_cell(row=target_row, column=min_col + i, value=item)
 
     def write_to_first_empty_row(self, data: Collection[str]) -> None:
-        for i, row in enumerate(self.rows):
+        for i, row in enumerate(self.iter_rows()):
             if row.is_empty():
                 self.write_to_row(i, data)
                 break
@@ -208,14 +312,27 @@ class ExcelRangeWritable(ExcelRange):
             raise Exception(f"Range {self} has no free rows to write to.")
 
     def write_data(self, data: Collection[Collection[str]]) -> None:
-        if len(data) > len(self.rows):
+        if isinstance(self.ws, ReadOnlyWorksheet):
+            raise Exception(f"Cannot write to {self}: workbook was opened read_only")
+
+        if isinstance(self.ws, WriteOnlyWorksheet):
+            for row_data in data:
+                self.ws.append(list(row_data))
+            return
+
+        min_col, min_row, max_col, max_row = self._range.bounds
+        row_count = max_row - min_row + 1
+
+        if len(data) > row_count:
             raise Exception(
                 f"Input data rows ({len(data)}) "
-                + f"are greater than range rows ({self}, {len(self.rows)})"
+                + f"are greater than range rows ({self}, {row_count})"
             )
 
-        for i, row_data in enumerate(data):
-            self.write_to_row(i, row_data)
+        ws_cell = self.ws.cell
+        for r, row_data in enumerate(data):
+            for i, item in enumerate(row_data):
+                ws_cell(row=min_row + r, column=min_col + i, value=item)
 
     def append_data(self, data: Collection[Collection[str]]) -> None:
         free_range = self.last_free_block
@@ -243,8 +360,28 @@ class ExcelRangeWritable(ExcelRange):
             self.ws.column_dimensions[col_letter].width = max_string_length
 
     def auto_adjust_column_widths(self) -> None:
-        for col_index in range(len(self.columns)):
-            self.auto_adjust_column_width(col_index)
+        # one values_only sweep over the range, tracking every column's
+        # max width as we go, instead of re-reading the range per column
+        min_col, min_row, max_col, max_row = self._range.bounds
+        widths = [0] * (max_col - min_col + 1)
+
+        for row in self.ws.iter_rows(
+            min_row=min_row,
+            max_row=max_row,
+            min_col=min_col,
+            max_col=max_col,
+            values_only=True,
+        ):
+            for j, value in enumerate(row):
+                if value is not None:
+                    length = len(str(value))
+                    if length > widths[j]:
+                        widths[j] = length
+
+        column_dimensions = self.ws.column_dimensions
+        for j, width in enumerate(widths):
+            if width > 0:
+                column_dimensions[get_column_letter(min_col + j)].width = width
 
     def set_alignment(
         self,
@@ -275,7 +412,7 @@ def get_range_object(
         else:
             return range
 
-    elif type(range) == str and worksheet is not None:
+    elif isinstance(range, str) and worksheet is not None:
         if writable:
             return ExcelRangeWritable(worksheet, range_expression=range)
         else:
@@ -289,7 +426,9 @@ class ExcelTable:
     def __init__(self, ws: Worksheet, table_object: Table) -> None:
         self._parent_ws = ws
         self._table = table_object
-        # self.categories: list[str] = [col.name for col in self._table.tableColumns]
+        self._col_name_to_idx = {
+            str(tc.name): i for i, tc in enumerate(self._table.tableColumns)
+        }
 
     def __str__(self) -> str:
         if self.name is None:
@@ -297,62 +436,178 @@ class ExcelTable:
         else:
             return f"{self.range} ({self.name})"
 
-    @property
+    @cached_property
     def categories(self) -> list[str]:
         return [col.name for col in self._table.tableColumns]
 
-    @property
+    @cached_property
     def columns(self) -> Mapping[str, ExcelRange]:
-        return {
-            str(tc.name): col
-            for col, tc in zip(self.range.columns, self._table.tableColumns)
-        }
+        range_columns = self.range.columns
+        return {name: range_columns[i] for name, i in self._col_name_to_idx.items()}
+
+    def get_column(self, name: str) -> ExcelRange:
+        return self.range.columns[self._col_name_to_idx[name]]
 
     @property
     def name(self) -> str | None:
         return self._table.name
 
-    @property
+    @cached_property
     def range(self) -> ExcelRange:
+        # parsing the A1 ref is paid once; mutators that reassign
+        # self._table.ref must pop this cache
         return ExcelRange(self._parent_ws, self._table.ref)
 
+    def _invalidate_range_cache(self) -> None:
+        self.__dict__.pop("range", None)
+        self.__dict__.pop("columns", None)
+
+    def _update_ref(self, ref: str) -> None:
+        # the only sanctioned way to move the table: keeps the cached
+        # range and column sub-ranges from outliving the old bounds
+        self._table.ref = ref
+        self._invalidate_range_cache()
+
+    def _first_free_row_index(self) -> int:
+        # 0-based index within the range of the first empty data row,
+        # or the range's row count when every data row is filled; one
+        # values sweep instead of a sub-range scan per row
+        min_col, min_row, max_col, max_row = self.range.bounds
+        index = 1
+        for row in self._parent_ws.iter_rows(
+            min_row=min_row + 1,
+            max_row=max_row,
+            min_col=min_col,
+            max_col=max_col,
+            values_only=True,
+        ):
+            if not _row_has_value(row):
+                return index
+            index += 1
+        return index
+
     @property
     def first_free_row(self) -> ExcelRange:
-        for row in self.range.rows[1:]:
-            if row.is_empty():
-                return row
-        else:
-            return self.range.next_row
+        rng = self.range
+        min_col, min_row, max_col, max_row = rng.bounds
+        free_row = min_row + self._first_free_row_index()
+        if free_row > max_row:
+            return rng.next_row
+        return type(rng)._from_ints(
+            self._parent_ws, free_row, min_col, free_row, max_col
+        )
 
 
 class ExcelTableWritable(ExcelTable):
-    @property
-    def range(self) -> ExcelRangeWritable:
-        return ExcelRangeWritable.convert_range_to_writable(super().range)
+    _append_cursor: Optional[int] = None
+    _dict_packer = None
 
-    @property
-    def columns(self) -> Mapping[str, ExcelRangeWritable]:
-        return {
-            k: ExcelRangeWritable.convert_range_to_writable(r)
-            for k, r in super().columns.items()
-        }
+    # column sub-ranges take the type of the parent range, so the
+    # inherited columns mapping already yields writable ranges here
+    @cached_property
+    def range(self) -> ExcelRangeWritable:
+        return ExcelRangeWritable(self._parent_ws, self._table.ref)
 
     def append(self, data: TableData):
-        category_index_map = {cat: i for i, cat in enumerate(self.categories)}
+        if not data:
+            return
+
+        # the entry shape is uniform in practice, so pick the specialized
+        # loop once instead of type-checking every row
+        if isinstance(data, Mapping):
+            self._append_columns(data)
+        elif isinstance(data[0], dict):
+            self._append_dicts(data)  # type: ignore[arg-type]
+        else:
+            self._append_sequences(data)  # type: ignore[arg-type]
 
+    def _append_sequences(
+        self, data: Sequence[Sequence[Any]], first_free_idx: Optional[int] = None
+    ) -> None:
+        self._emit_rows(data, first_free_idx)
+
+    def _append_dicts(
+        self, data: Sequence[dict[str, Any]], first_free_idx: Optional[int] = None
+    ) -> None:
+        categories = self.categories
+        category_index_map = {cat: i for i, cat in enumerate(categories)}
+        category_count = len(categories)
+
+        if self._dict_packer is None:
+            # the schema is fixed for the life of the table, so one
+            # C-level itemgetter replaces the per-row category loop for
+            # fully populated entries
+            self._dict_packer = itemgetter(*categories)
+        packer = self._dict_packer
+        single_category = category_count == 1
+
+        rows: list[Sequence[Any]] = []
         for entry in data:
-            if type(entry) == dict:
-                row_values: Sequence[Any] = [None] * len(self.categories)
-                for category, value in entry.items():
-                    row_values[category_index_map[category]] = value
+            if len(entry) == category_count:
+                try:
+                    packed = packer(entry)
+                    rows.append((packed,) if single_category else packed)
+                    continue
+                except KeyError:
+                    pass
+
+            # sparse or mis-keyed entry: positional fill with None gaps
+            row_values = [None] * category_count
+            for category, value in entry.items():
+                row_values[category_index_map[category]] = value
+            rows.append(row_values)
+
+        self._emit_rows(rows, first_free_idx)
+
+    def _append_columns(
+        self, data: Mapping[str, Sequence[Any]], first_free_idx: Optional[int] = None
+    ) -> None:
+        # column-oriented input: zip the per-category lists into rows
+        # once, padding short or missing categories with None
+        columns = [data.get(cat, ()) for cat in self.categories]
+        rows = list(zip_longest(*columns))
+        if rows:
+            self._emit_rows(rows, first_free_idx)
+
+    def _emit_rows(
+        self, rows: Sequence[Sequence[Any]], first_free_idx: Optional[int] = None
+    ) -> None:
+        if isinstance(self._parent_ws, WriteOnlyWorksheet):
+            ws_append = self._parent_ws.append
+            for row_values in rows:
+                # type-identity compare keeps the 99% shapes off the
+                # list-copy path; ws.append takes lists and tuples as-is
+                t = type(row_values)
+                if t is not list and t is not tuple:
+                    row_values = list(row_values)
+                ws_append(row_values)
+            return
+
+        rng = self.range
+        first_row, last_row = rng.row_bounds
+        row_count = last_row - first_row + 1
+
+        if first_free_idx is not None:
+            next_free_idx = first_free_idx
+        elif self._append_cursor is not None:
+            # later appends resume where the previous one stopped, so the
+            # scan below is paid once per table instead of once per call
+            next_free_idx = self._append_cursor
+        else:
+            next_free_idx = self._first_free_row_index()
 
-            elif isinstance(entry, Sequence):
-                row_values = entry
+        # grow the range once for the whole batch rather than a row at
+        # a time, so the ref is re-serialized once per append
+        overflow = next_free_idx + len(rows) - row_count
+        if overflow > 0:
+            rng.expand(down=overflow)
 
-            else:
-                raise Exception("ERROR 10: YOU SHOULD NEVER SEE THIS")
+        for row_values in rows:
+            rng.write_to_row(next_free_idx, row_values)
+            next_free_idx += 1
 
-            self.range.write_to_first_empty_row(row_values)
+        self._append_cursor = next_free_idx
+        self._update_ref(str(rng))
 
     def change_style(self, style: str) -> None:
         table_style = TableStyleInfo(name=style)
@@ -368,15 +623,19 @@ class ExcelTableWritable(ExcelTable):
         self, categories: Optional[Collection[str]] = None
     ) -> None:
         if categories is None:
-            categories = self.categories
+            # fitting every column is one fused sweep over the table range
+            self.range.auto_adjust_column_widths()
+            return
 
+        columns = self.columns
         for category in categories:
-            column = self.columns[category]
-            column.auto_adjust_column_widths()
+            columns[category].auto_adjust_column_width(0)
 
 
 class NewExcelTable(ExcelTableWritable):
-    TABLE_INDEX = 0
+    # next(count) is a single atomic step in CPython, so generated names
+    # stay unique even when sheets are written from multiple threads
+    _index_iter = count(1)
 
     def __init__(
         self,
@@ -388,10 +647,12 @@ class NewExcelTable(ExcelTableWritable):
         auto_adjust_widths: bool = False,
         **table_kwargs,
     ) -> None:
-        range = get_range_object(range, writable=True)
+        range = get_range_object(range, worksheet=ws, writable=True)
         assert isinstance(range, ExcelRangeWritable)
 
         if categories is not None:
+            # growing the range is O(1); ws.insert_rows would have to walk
+            # every cell below the insertion point to shift its row index
             range.expand(down=1)
             range.write_to_row(0, categories)
 
@@ -413,14 +674,20 @@ class NewExcelTable(ExcelTableWritable):
         super().__init__(ws, ws.tables[table_name])
 
         if initial_data:
-            self.append(initial_data)
+            # the rows below the freshly written header are known to be
+            # empty, so write sequentially without the empty-row scan
+            if isinstance(initial_data, Mapping):
+                self._append_columns(initial_data, first_free_idx=1)
+            elif isinstance(initial_data[0], dict):
+                self._append_dicts(initial_data, first_free_idx=1)  # type: ignore[arg-type]
+            else:
+                self._append_sequences(initial_data, first_free_idx=1)  # type: ignore[arg-type]
 
         if auto_adjust_widths:
             range.auto_adjust_column_widths()
 
     def _next_table_name(self) -> str:
-        NewExcelTable.TABLE_INDEX += 1
-        return f"EasyXLTable{NewExcelTable.TABLE_INDEX}"
+        return f"EasyXLTable{next(NewExcelTable._index_iter)}"
 
 
 # todo: refactor so that the base classes below are in their respective files
@@ -429,16 +696,37 @@ class NewExcelTable(ExcelTableWritable):
 
 
 class WorkbookOpenBase:
-    def __init__(self, file_path: Path) -> None:
+    # the formats openpyxl can actually open; rejecting anything else up
+    # front saves a doomed full XML parse
+    _EXCEL_SUFFIXES = frozenset((".xlsx", ".xlsm", ".xltx", ".xltm"))
+
+    def __init__(self, file_path: Path, read_only: bool = False) -> None:
         if not file_path.is_file():
             raise FileNotFoundError(str(file_path))
-        elif not file_path.suffix.startswith(".xl"):
+        elif file_path.suffix.lower() not in self._EXCEL_SUFFIXES:
             raise InvalidFile(file_path)
 
         self.file_path = file_path
-        self.wb: Workbook = load_workbook(str(self.file_path))
+        self.read_only = read_only
+        self.wb: Workbook = self._load_workbook()
         self.current_worksheet = self.wb.worksheets[0]
 
+    def _load_workbook(self) -> Workbook:
+        if self.read_only:
+            # read_only streams rows from the archive instead of building
+            # a Cell object per coordinate, so huge workbooks load in
+            # seconds instead of minutes
+            return load_workbook(
+                str(self.file_path),
+                read_only=True,
+                data_only=True,
+                keep_links=False,
+            )
+        return load_workbook(str(self.file_path))
+
+    def close(self) -> None:
+        self.wb.close()
+
     def get_worksheet_by_title(self, title: str) -> Worksheet:
         if title not in self.wb.sheetnames:
             raise InvalidSheet(self.wb, name=title)
@@ -452,15 +740,6 @@ class WorkbookOpenBase:
         return self.wb.worksheets[index]
 
 
-class WorkbookEditorBase(WorkbookOpenBase):
-    def save(self) -> None:
-        self.wb.save(self.file_path)
-
-
-class WorkbookCreatorBase(WorkbookEditorBase):
-    def __init__(self) -> None:
-        self.wb: Workbook = Workbook(write_only=True)
-        self.current_worksheet = self.wb.worksheets[0]
-
-    def save(self, file_path: Path) -> None:
-        self.wb.save(file_path)
+class WorkbookReadOnlyBase(WorkbookOpenBase):
+    def __init__(self, file_path: Path) -> None:
+        super().__init__(file_path, read_only=True)
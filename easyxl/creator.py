@@ -8,7 +8,11 @@ from easyxl.editor import WorkbookEditor
 
 class WorkbookCreator(WorkbookEditor):
     def __init__(self) -> None:
-        self.wb: Workbook = Workbook()
+        # write_only streams rows straight to the archive as they are
+        # appended, keeping peak memory at roughly one row instead of the
+        # whole cell grid
+        self.wb: Workbook = Workbook(write_only=True)
+        self.current_worksheet = self.wb.create_sheet()
 
     def save(self, save_path: Path) -> None:
         self.wb.save(save_path)
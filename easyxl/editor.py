@@ -1,4 +1,4 @@
-from typing import Optional, Collection
+from typing import Optional, Collection, Mapping
 from pathlib import Path
 
 from openpyxl.worksheet.worksheet import Worksheet
@@ -8,7 +8,6 @@ from easyxl.base import (
     NewExcelTable,
     SupportsRange,
     TableData,
-    WorkbookEditorBase,
 )
 from easyxl.reader import WorkbookReader
 
@@ -27,7 +26,14 @@ class WorkbookEditor(WorkbookReader):
                 raise Exception("Cannot create a table with no header categories!")
 
             width = len(categories)
-            length = len(initial_data) if initial_data is not None else 1
+            if initial_data is None:
+                length = 1
+            elif isinstance(initial_data, Mapping):
+                # column-oriented data: the row count is the longest column,
+                # not the number of categories
+                length = max(map(len, initial_data.values()), default=1)
+            else:
+                length = len(initial_data)
 
             # don't adjust for header row, NewExcelTable does it for us
             range = ExcelRangeWritable(ws, "A1:A1")
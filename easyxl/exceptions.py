@@ -6,13 +6,16 @@ from openpyxl import Workbook
 class InvalidFile(Exception):
     def __init__(self, file_path: Path, *args: object) -> None:
         super().__init__(*args)
-        self.file_uri = str(file_path)
 
-        if len(str(file_path)) > 60:
-            self.file_uri = "..." + str(file_path)[-60:]
+        file_uri = str(file_path)
+        if len(file_uri) > 60:
+            file_uri = "..." + file_uri[-60:]
+
+        self.file_uri = file_uri
+        self._msg = f"{self.file_uri} is not a valid Excel file"
 
     def __str__(self) -> str:
-        return f"{self.file_uri} is not a valid Excel file"
+        return self._msg
 
 
 class InvalidSheet(Exception):
@@ -1,7 +1,18 @@
+from bisect import bisect_right
+
 from openpyxl import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.table import Table
 
-from easyxl.base import ExcelRange, ExcelTable, WorkbookOpenBase, Coordinate
+from easyxl.base import (
+    ExcelRange,
+    ExcelTable,
+    WorkbookOpenBase,
+    WorkbookReadOnlyBase,
+    Coordinate,
+)
 
 
 class WorkbookReader(WorkbookOpenBase):
@@ -16,21 +27,58 @@ class WorkbookReader(WorkbookOpenBase):
         return ExcelRange(worksheet, coordinates=coordinates)
 
     def get_worksheet_data_range(self, worksheet: Worksheet) -> ExcelRange:
-        ws_rows = list(worksheet.rows)
-        top_left_coordinate = ws_rows[0][0].coordinate
-        bottom_right_coordinate = ws_rows[-1][-1].coordinate
+        if isinstance(worksheet, ReadOnlyWorksheet):
+            # resolved from the sheet's <dimension> tag when one was
+            # recorded; force streams the rows once for unsized sheets
+            try:
+                dimension = worksheet.calculate_dimension()
+            except ValueError:
+                dimension = worksheet.calculate_dimension(force=True)
+            return ExcelRange(worksheet, range_expression=dimension)
 
+        # the worksheet tracks its used bounds, so there is no need to
+        # materialize every row just to read two coordinates
         return ExcelRange(
             worksheet,
-            range_expression=f"{top_left_coordinate}:{bottom_right_coordinate}",
+            coordinates=(
+                (worksheet.min_row, worksheet.min_column),
+                (worksheet.max_row, worksheet.max_column),
+            ),
         )
 
+    def _check_tables_parsed(self, worksheet: Worksheet) -> None:
+        # streaming worksheets never carry .tables, so every table lookup
+        # has to fail the same way instead of leaking an AttributeError
+        if isinstance(worksheet, ReadOnlyWorksheet):
+            raise Exception(
+                f"Worksheet '{worksheet.title}' was opened read_only;"
+                + " table definitions are only parsed by the full workbook model"
+            )
+
     def all_worksheet_tables(self, worksheet: Worksheet) -> dict[str, ExcelTable]:
+        self._check_tables_parsed(worksheet)
+
+        # wrapper dict is memoized per sheet and rebuilt when any table's
+        # ref changes; the wrappers cache their parsed range, so keying
+        # on the refs also retires wrappers whose cached bounds went stale
+        # when a table grew in place
+        if not hasattr(self, "_table_wrapper_cache"):
+            self._table_wrapper_cache: dict = {}
+
         worksheet_tables = worksheet.tables
-        return {
-            name: ExcelTable(worksheet, table)
-            for name, table in worksheet_tables.items()
+        refs = tuple(table.ref for table in worksheet_tables.values())
+        cached = self._table_wrapper_cache.get(worksheet.title)
+        if cached is not None and cached[0] == refs:
+            return cached[1]
+
+        # TableList.items() yields name -> ref strings, so iterate the
+        # Table objects themselves
+        wrapped = {
+            table.name: ExcelTable(worksheet, table)
+            for table in worksheet_tables.values()
         }
+        self._table_wrapper_cache[worksheet.title] = (refs, wrapped)
+        return wrapped
 
     def all_tables(self) -> dict[str, ExcelTable]:
         workbook_tables = {}
@@ -38,18 +86,61 @@ class WorkbookReader(WorkbookOpenBase):
             workbook_tables.update(self.all_worksheet_tables(worksheet))
         return workbook_tables
 
+    def _worksheet_table_index(
+        self, worksheet: Worksheet
+    ) -> tuple[list[tuple[int, int, int, int, Table]], list[int]]:
+        self._check_tables_parsed(worksheet)
+
+        # per-sheet list of (min_row, min_col, max_row, max_col, table)
+        # sorted by min_row, rebuilt when any table's ref changes; keying
+        # on the refs (not the count) catches appends that grow a table
+        # in place as well as add_table / convert_ws_to_table
+        if not hasattr(self, "_table_index"):
+            self._table_index: dict = {}
+
+        tables = worksheet.tables
+        refs = tuple(table.ref for table in tables.values())
+        cached = self._table_index.get(worksheet.title)
+        if cached is not None and cached[0] == refs:
+            return cached[1], cached[2]
+
+        entries = []
+        for table in tables.values():
+            min_col, min_row, max_col, max_row = CellRange(table.ref).bounds
+            entries.append((min_row, min_col, max_row, max_col, table))
+        entries.sort(key=lambda entry: entry[0])
+        min_rows = [entry[0] for entry in entries]
+
+        self._table_index[worksheet.title] = (refs, entries, min_rows)
+        return entries, min_rows
+
     def get_table_by_range(
         self, worksheet: Worksheet, range: ExcelRange
     ) -> ExcelTable | None:
-        ws_tables = list(self.all_worksheet_tables(worksheet).values())
-        matching_tables = [t for t in ws_tables if t.range.issuperset(range)]
+        entries, min_rows = self._worksheet_table_index(worksheet)
+        q_min_col, q_min_row, q_max_col, q_max_row = range.bounds
 
-        if not matching_tables:
+        # only tables starting at or above the queried range can contain it
+        matches = []
+        for min_row, min_col, max_row, max_col, table in entries[
+            : bisect_right(min_rows, q_min_row)
+        ]:
+            if min_col <= q_min_col and max_row >= q_max_row and max_col >= q_max_col:
+                matches.append(table)
+
+        if not matches:
             return None
 
-        if len(matching_tables) > 1:
+        if len(matches) > 1:
             raise Exception(
-                f'Range {range} matches multiple tables: {", ".join(str(t) for t in matching_tables)}'
+                f"Range {range} matches multiple tables: "
+                + ", ".join(str(ExcelTable(worksheet, t)) for t in matches)
             )
 
-        return matching_tables[0]
+        return ExcelTable(worksheet, matches[0])
+
+
+# note: openpyxl's streaming worksheets do not carry table definitions,
+# so the table lookup methods only work on a full-model WorkbookReader
+class ReadOnlyWorkbookReader(WorkbookReadOnlyBase, WorkbookReader):
+    pass